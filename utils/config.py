@@ -1,27 +1,103 @@
 from dotenv import load_dotenv
+from functools import lru_cache
+from sqlalchemy.engine import URL
+from typing import Tuple
 import os
 
-load_dotenv()
+_ENV_LOADED = False
+
+
+def _load_env():
+    """Load variables from `.env` into the environment, once per process."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
 
 # Reddit
-CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
-SECRET_KEY = os.getenv("REDDIT_SECRET_KEY")
-USER_AGENT = os.getenv("REDDIT_USER_AGENT")
+@lru_cache
+def reddit_user_agent() -> str:
+    """
+    Returns the User-Agent sent with every Reddit API request.
+
+    Returns:
+        str: Reddit API user agent
+    """
+    _load_env()
+    return os.environ["REDDIT_USER_AGENT"]
+
+
+@lru_cache
+def reddit_creds() -> Tuple[str, str, str]:
+    """
+    Returns the Reddit API credentials.
+
+    Returns:
+        Tuple[str, str, str]: Client ID, secret key and user agent
+    """
+    _load_env()
+    return (
+        os.environ["REDDIT_CLIENT_ID"],
+        os.environ["REDDIT_SECRET_KEY"],
+        reddit_user_agent(),
+    )
+
 
 # Source Database
-SOURCE_DB_USERNAME = os.getenv("SOURCE_DB_USERNAME")
-SOURCE_DB_PASSWORD = os.getenv("SOURCE_DB_PASSWORD")
-SOURCE_DB_HOST = os.getenv("SOURCE_DB_HOST")
-SOURCE_DB_PORT = os.getenv("SOURCE_DB_PORT")
-SOURCE_DB_NAME = os.getenv("SOURCE_DB_NAME")
+@lru_cache
+def source_db_url() -> URL:
+    """
+    Returns the connection URL for the source database.
+
+    Credentials are passed as separate URL components, so passwords with
+    special characters do not need to be escaped.
+
+    Returns:
+        sqlalchemy.engine.URL: PostgreSQL connection URL
+    """
+    _load_env()
+    return URL.create(
+        "postgresql+psycopg",
+        username=os.environ["SOURCE_DB_USERNAME"],
+        password=os.environ["SOURCE_DB_PASSWORD"],
+        host=os.environ["SOURCE_DB_HOST"],
+        port=int(os.environ["SOURCE_DB_PORT"]),
+        database=os.environ["SOURCE_DB_NAME"],
+    )
+
 
 # Warehouse Database
-WAREHOUSE_DB_USERNAME = os.getenv("WAREHOUSE_DB_USERNAME")
-WAREHOUSE_DB_PASSWORD = os.getenv("WAREHOUSE_DB_PASSWORD")
-WAREHOUSE_DB_HOST = os.getenv("WAREHOUSE_DB_HOST")
-WAREHOUSE_DB_PORT = os.getenv("WAREHOUSE_DB_PORT")
-WAREHOUSE_DB_NAME = os.getenv("WAREHOUSE_DB_NAME")
+@lru_cache
+def warehouse_db_url() -> URL:
+    """
+    Returns the connection URL for the data warehouse.
+
+    Credentials are passed as separate URL components, so passwords with
+    special characters do not need to be escaped.
+
+    Returns:
+        sqlalchemy.engine.URL: PostgreSQL connection URL
+    """
+    _load_env()
+    return URL.create(
+        "postgresql+psycopg",
+        username=os.environ["WAREHOUSE_DB_USERNAME"],
+        password=os.environ["WAREHOUSE_DB_PASSWORD"],
+        host=os.environ["WAREHOUSE_DB_HOST"],
+        port=int(os.environ["WAREHOUSE_DB_PORT"]),
+        database=os.environ["WAREHOUSE_DB_NAME"],
+    )
+
 
 # Fetch Data
-SUBREDDIT = os.getenv("SUBREDDIT")
-LIMIT = int(os.getenv("LIMIT"))  # type: ignore
+@lru_cache
+def fetch_params() -> Tuple[str, int]:
+    """
+    Returns the subreddit and post limit to fetch.
+
+    Returns:
+        Tuple[str, int]: Subreddit name and number of posts to fetch
+    """
+    _load_env()
+    return os.environ["SUBREDDIT"], int(os.environ["LIMIT"])
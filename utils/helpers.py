@@ -1,27 +1,29 @@
+import logging
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine
-from config import (
-    SOURCE_DB_USERNAME,
-    SOURCE_DB_PASSWORD,
-    SOURCE_DB_HOST,
-    SOURCE_DB_PORT,
-    SOURCE_DB_NAME,
-    WAREHOUSE_DB_USERNAME,
-    WAREHOUSE_DB_PASSWORD,
-    WAREHOUSE_DB_HOST,
-    WAREHOUSE_DB_PORT,
-    WAREHOUSE_DB_NAME,
-)
+from sqlalchemy.engine import URL
+from utils.config import source_db_url, warehouse_db_url
+
+logger = logging.getLogger(__name__)
+
+# Directories already ensured during this process
+_CREATED: set[str] = set()
+
+# Connection pool settings shared by all engines
+POOL_OPTIONS = {"pool_size": 5, "max_overflow": 10, "pool_recycle": 1800}
+
+# Stream query results from a server-side cursor instead of buffering them
+EXECUTION_OPTIONS = {"stream_results": True, "yield_per": 10_000}
 
 
 def create_directories():
     """
     Creates a set of directories if they do not already exist.
 
-    This function checks for the existence of the directories specified in the
-    `directories` list. If a directory does not exist, it creates the directory
-    and prints a message indicating that the directory was created. If the directory
-    already exists, it prints a message indicating that the directory already exists.
+    Each directory in the `directories` list is created with
+    `os.makedirs(exist_ok=True)`, so existing directories are left untouched.
+    Directories already ensured earlier in the same process are skipped.
 
     Directories created:
     - data/raw
@@ -30,44 +32,71 @@ def create_directories():
     """
     directories = ["data/raw", "data/transform", "data/load"]
     for directory in directories:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Directory created: {directory}")
-        else:
-            print(f"Directory already exists: {directory}")
+        if directory in _CREATED:
+            continue
+        os.makedirs(directory, exist_ok=True)
+        _CREATED.add(directory)
+        logger.debug("Directory ensured: %s", directory)
+
+
+@lru_cache(maxsize=None)
+def _engine(url: URL, pool_pre_ping: bool):
+    """
+    Creates the engine for `url`, cached so each URL and pre-ping setting
+    shares one connection pool for the life of the process.
+
+    Args:
+        url (sqlalchemy.engine.URL): Database connection URL.
+        pool_pre_ping (bool): Test pooled connections before use.
+
+    Returns:
+        sqlalchemy.engine.Engine: A SQLAlchemy engine instance for `url`.
+    """
+    return create_engine(
+        url,
+        pool_pre_ping=pool_pre_ping,
+        execution_options=EXECUTION_OPTIONS,
+        **POOL_OPTIONS,
+    )
 
 
-def source_db_engine():
+def source_db_engine(pool_pre_ping: bool = False):
     """
     Creates and returns a SQLAlchemy engine for connecting to the source database.
 
     The engine is configured using environment variables for the database
     credentials and connection details, including username, password, host, port,
-    and database name.
+    and database name. The engine is cached, so repeated calls share one
+    connection pool.
+
+    Args:
+        pool_pre_ping (bool, optional): Test pooled connections before use, for
+                                        unreliable networks. Defaults to False.
 
     Returns:
         sqlalchemy.engine.Engine: A SQLAlchemy engine instance for the source database.
     """
-    engine = create_engine(
-        f"postgresql://{SOURCE_DB_USERNAME}:{SOURCE_DB_PASSWORD}@{SOURCE_DB_HOST}:{SOURCE_DB_PORT}/{SOURCE_DB_NAME}"
-    )
+    engine = _engine(source_db_url(), bool(pool_pre_ping))
 
     return engine
 
 
-def dw_engine():
+def dw_engine(pool_pre_ping: bool = False):
     """
     Creates and returns a SQLAlchemy engine for connecting to the data warehouse.
 
     The engine is configured using environment variables for the warehouse
-    database credentials and connection details.
+    database credentials and connection details. The engine is cached, so
+    repeated calls share one connection pool.
+
+    Args:
+        pool_pre_ping (bool, optional): Test pooled connections before use, for
+                                        unreliable networks. Defaults to False.
 
     Returns:
         sqlalchemy.engine.base.Engine: A SQLAlchemy engine instance for the
         warehouse database.
     """
-    warehouse_engine = create_engine(
-        f"postgresql://{WAREHOUSE_DB_USERNAME}:{WAREHOUSE_DB_PASSWORD}@{WAREHOUSE_DB_HOST}:{WAREHOUSE_DB_PORT}/{WAREHOUSE_DB_NAME}"
-    )
+    warehouse_engine = _engine(warehouse_db_url(), bool(pool_pre_ping))
 
     return warehouse_engine
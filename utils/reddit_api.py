@@ -1,11 +1,118 @@
 # type: ignore
+import logging
+import os
+import threading
+import time
 import requests
-from utils.config import USER_AGENT
-from typing import List, Dict, Any
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from requests.utils import quote
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from utils.config import reddit_user_agent
+from utils.reddit_common import (
+    BACKOFF_FACTOR,
+    BASE_URL,
+    MAX_RETRIES,
+    RATE_LIMIT_PERIOD,
+    RATE_LIMIT_REQUESTS,
+    RETRY_STATUSES,
+    orjson,
+    parse_comments,
+)
+from typing import List, Dict, Any, Optional, Tuple
+from enum import StrEnum
+
+
+def _build_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    Build a requests Session with keep-alive connection pooling and retries.
+
+    Failed requests are retried by the adapter, so callers only see an
+    exception once retries are exhausted.
+
+    Args:
+        pool_maxsize (int, optional): Maximum number of pooled connections per
+                                      host. Defaults to 20.
+
+    Returns:
+        requests.Session: Session with an HTTPAdapter mounted for https://
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=pool_maxsize,
+        # Retry rate limiting and transient server errors with exponential
+        # backoff, honouring Retry-After. The token request is a POST but is
+        # safe to repeat, so POST is retried as well.
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods=["GET", "POST"],
+        ),
+    )
+    session.mount("https://", adapter)
+    user_agent = reddit_user_agent()
+    # Advertise every encoding urllib3 can decode (gzip/deflate, plus br and
+    # zstd when their decoders are installed) so proxies do not strip it
+    session.headers.update(make_headers(accept_encoding=True))
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+logger = logging.getLogger(__name__)
+
+# Shared Session, built on first use by get_session()
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Form body for the client credentials grant
+_AUTH_DATA = {"grant_type": "client_credentials"}
+
+# Reddit tokens last 3600s; treat cached ones as fresh with a safety margin
+TOKEN_CACHE_PATH = "data/.reddit_token.json"
+TOKEN_CACHE_TTL = 3300
+
+# Maximum number of items Reddit returns per listing page
+PAGE_SIZE = 100
+
+
+class _RateLimiter:
+    """Sliding-window limiter: each acquired slot is released after `period` seconds."""
+
+    def __init__(self, max_requests: int, period: float):
+        self._semaphore = threading.Semaphore(max_requests)
+        self._period = period
+
+    def acquire(self) -> None:
+        self._semaphore.acquire()
+        timer = threading.Timer(self._period, self._semaphore.release)
+        timer.daemon = True
+        timer.start()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared Session used by all Reddit API calls in this module.
+
+    The Session is built on first use, so importing this module does not
+    require the Reddit environment variables to be set.
 
+    Returns:
+        requests.Session: The module-level Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
 
-class RedditTimeline(Enum):
+
+class RedditTimeline(StrEnum):
     """Available Reddit post timeline options."""
 
     HOT = "hot"
@@ -14,6 +121,31 @@ class RedditTimeline(Enum):
     RISING = "rising"
 
 
+@lru_cache(maxsize=4)
+def _basic_auth(
+    client_id: str, secret_key: str
+) -> requests.auth.HTTPBasicAuth:
+    """Return a reusable HTTPBasicAuth for the given client credentials."""
+    return requests.auth.HTTPBasicAuth(client_id, secret_key)
+
+
+def _authorize(session: requests.Session, token: str) -> requests.Session:
+    """
+    Set the bearer token on `session`, only touching its headers when it changes.
+
+    Args:
+        session (requests.Session): Session to authorize
+        token (str): OAuth access token
+
+    Returns:
+        requests.Session: The same session, for chaining
+    """
+    authorization = f"bearer {token}"
+    if session.headers.get("Authorization") != authorization:
+        session.headers["Authorization"] = authorization
+    return session
+
+
 def get_access_token(client_id: str, secret_key: str) -> str:
     """
     Get Reddit API access token using client credentials flow.
@@ -30,15 +162,11 @@ def get_access_token(client_id: str, secret_key: str) -> str:
         ValueError: If response is invalid or authentication fails
     """
     try:
-        auth = requests.auth.HTTPBasicAuth(client_id, secret_key)
-        data = {"grant_type": "client_credentials"}
-        headers = {"User-Agent": USER_AGENT}
-
-        response = requests.post(
+        # Basic auth overrides any bearer token set on the shared session
+        response = get_session().post(
             "https://www.reddit.com/api/v1/access_token",
-            auth=auth,
-            data=data,
-            headers=headers,
+            auth=_basic_auth(client_id, secret_key),
+            data=_AUTH_DATA,
             timeout=30,
         )
 
@@ -58,6 +186,103 @@ def get_access_token(client_id: str, secret_key: str) -> str:
         raise ValueError(f"Invalid response from Reddit API: {str(e)}")
 
 
+def _read_cached_token(
+    client_id: str,
+) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Read the cached access token for `client_id`.
+
+    Args:
+        client_id (str): Reddit API client ID the token was issued to
+
+    Returns:
+        Tuple[Optional[str], Optional[float]]: The token and its age in
+                                               seconds, or (None, None) if no
+                                               usable cache entry exists
+    """
+    try:
+        age = time.time() - os.path.getmtime(TOKEN_CACHE_PATH)
+        with open(TOKEN_CACHE_PATH, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None, None
+
+    if not isinstance(cached, dict):
+        return None, None
+
+    if cached.get("client_id") != client_id or not cached.get("access_token"):
+        return None, None
+
+    return cached["access_token"], age
+
+
+def _write_cached_token(client_id: str, token: str) -> None:
+    """
+    Atomically write the access token cache file.
+
+    Args:
+        client_id (str): Reddit API client ID the token was issued to
+        token (str): Access token to cache
+    """
+    os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+    payload = orjson.dumps({"client_id": client_id, "access_token": token})
+    if isinstance(payload, str):  # stdlib json fallback returns str
+        payload = payload.encode()
+
+    # The token is a credential: create the file readable by the owner only.
+    # A leftover temp file is removed first so it cannot keep looser
+    # permissions from an earlier run.
+    tmp_path = f"{TOKEN_CACHE_PATH}.tmp"
+    try:
+        os.remove(tmp_path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, TOKEN_CACHE_PATH)
+
+
+def get_access_token_cached(client_id: str, secret_key: str) -> str:
+    """
+    Get Reddit API access token, reusing a token cached on disk while fresh.
+
+    A cached token younger than `TOKEN_CACHE_TTL` seconds is returned without
+    contacting Reddit. Otherwise a new token is requested via
+    `get_access_token` and cached. If that request fails while an expired
+    token is cached, the stale token is returned and a warning is logged.
+
+    Args:
+        client_id (str): Reddit API client ID
+        secret_key (str): Reddit API secret key
+
+    Returns:
+        str: Access token
+
+    Raises:
+        requests.exceptions.RequestException: If API request fails and no cached token exists
+        ValueError: If response is invalid and no cached token exists
+    """
+    cached_token, age = _read_cached_token(client_id)
+    if cached_token and age < TOKEN_CACHE_TTL:
+        return cached_token
+
+    try:
+        token = get_access_token(client_id, secret_key)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if not cached_token:
+            raise
+        logger.warning("Using stale cached access token: %s", e)
+        return cached_token
+
+    try:
+        _write_cached_token(client_id, token)
+    except OSError as e:
+        logger.warning("Failed to cache access token: %s", e)
+
+    return token
+
+
 def fetch_posts(
     subreddit: str,
     limit: int,
@@ -72,7 +297,9 @@ def fetch_posts(
         timeline (RedditTimeline, optional): Timeline to fetch posts from.
                                            Defaults to HOT.
                                            Options: HOT, NEW, TOP, RISING
-        limit (int): Number of posts to fetch. Maximum allowed by Reddit API is 100.
+        limit (int): Number of posts to fetch. Limits above 100 (Reddit's page
+                     size) are fetched over several pages using the `after`
+                     cursor. Fewer posts are returned if the listing runs out.
 
     Returns:
         List[Dict[str, Any]]: List of post data dictionaries containing post information
@@ -85,55 +312,132 @@ def fetch_posts(
     if not subreddit or not isinstance(subreddit, str):
         raise ValueError("Subreddit name must be a non-empty string")
 
-    if not isinstance(limit, int) or limit < 1 or limit > 100:
-        raise ValueError("Limit must be an integer between 1 and 100")
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError("Limit must be a positive integer")
 
     try:
-        headers = {
-            "Authorization": f"bearer {token}",
-            "User-Agent": USER_AGENT,
-        }
+        session = _authorize(get_session(), token)
 
-        url = f"https://oauth.reddit.com/r/{subreddit}/{timeline.value}"
-        params = {"limit": limit}
+        # Keep "+" unescaped so multi-subreddit names like "a+b" still work
+        url = f"{BASE_URL}/r/{quote(subreddit, safe='+')}/{timeline}"
 
-        response = requests.get(
-            url=url, headers=headers, params=params, timeout=30
+        posts = []
+        after = None
+        remaining = limit
+        while remaining > 0:
+            params = {"limit": min(remaining, PAGE_SIZE)}
+            if after:
+                params["after"] = after
+
+            response = session.get(url=url, params=params, timeout=30)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+
+            # Validate response structure
+            if "data" not in data or "children" not in data["data"]:
+                raise KeyError("Invalid API response structure")
+
+            # Extract post data and filter relevant information
+            children = data["data"]["children"]
+            for post in children[:remaining]:
+                if "data" in post:
+                    posts.append(post["data"])
+            remaining -= len(children)
+
+            # Stop when the listing has no further pages
+            after = data["data"].get("after")
+            if not after or not children:
+                break
+
+        return posts
+
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(
+            f"Failed to fetch posts from r/{subreddit}: {str(e)}"
         )
-        response.raise_for_status()
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Error processing response data: {str(e)}")
+
+
+def fetch_posts_info(
+    post_ids: List[str], token: str, session: requests.Session = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch metadata for many posts by ID using Reddit's `/api/info` endpoint.
+
+    IDs are looked up 100 at a time, so N posts cost ceil(N / 100) requests
+    instead of one per post. Comment trees are not included; those still
+    require the per-post endpoint used by `fetch_comments`.
+
+    Args:
+        post_ids (List[str]): IDs of the posts to look up, without the `t3_` prefix
+        token (str): The OAuth token for authenticating the API requests
+        session (requests.Session, optional): Session to issue the requests on.
+                                              Defaults to the shared module Session.
+
+    Returns:
+        List[Dict[str, Any]]: List of post data dictionaries. Posts that no
+                              longer exist are omitted.
 
-        data = response.json()
+    Raises:
+        ValueError: If post_ids is empty or the response cannot be processed
+        requests.exceptions.RequestException: If API request fails
+    """
+    if not post_ids or not all(isinstance(pid, str) for pid in post_ids):
+        raise ValueError("Post IDs must be a non-empty list of strings")
 
-        # Validate response structure
-        if "data" not in data or "children" not in data["data"]:
-            raise KeyError("Invalid API response structure")
+    try:
+        session = _authorize(session or get_session(), token)
+
+        url = f"{BASE_URL}/api/info"
 
-        # Extract post data and filter relevant information
         posts = []
-        for post in data["data"]["children"]:
-            if "data" in post:
-                posts.append(post["data"])
+        for start in range(0, len(post_ids), PAGE_SIZE):
+            fullnames = ",".join(
+                f"t3_{pid}" for pid in post_ids[start : start + PAGE_SIZE]
+            )
+
+            response = session.get(
+                url=url, params={"id": fullnames}, timeout=30
+            )
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+
+            # Validate response structure
+            if "data" not in data or "children" not in data["data"]:
+                raise KeyError("Invalid API response structure")
+
+            for post in data["data"]["children"]:
+                if "data" in post:
+                    posts.append(post["data"])
 
         return posts
 
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(
-            f"Failed to fetch posts from r/{subreddit}: {str(e)}"
+            f"Failed to fetch post info: {str(e)}"
         )
     except (KeyError, ValueError) as e:
         raise ValueError(f"Error processing response data: {str(e)}")
 
 
-def fetch_comments(post_id: str, token: str):
+def fetch_comments(
+    post_id: str, token: str, session: requests.Session = None
+) -> Dict[str, List[Any]]:
     """
     Fetches and processes comments for a given Reddit post.
 
     Args:
         post_id (str): The ID of the Reddit post to fetch comments for.
         token (str): The OAuth token for authenticating the API request.
+        session (requests.Session, optional): Session to issue the request on.
+                                              Defaults to the shared module Session.
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries containing processed comment data.
+        Dict[str, List[Any]]: Processed comment data as columns, one list per
+                              field, ready for `pd.DataFrame(comments, copy=False)`.
 
     Raises:
         ValueError: If the post_id is invalid or if there is an error processing the comment data.
@@ -143,93 +447,17 @@ def fetch_comments(post_id: str, token: str):
         raise ValueError("Post ID must be a non-empty string")
 
     try:
-        headers = {
-            "Authorization": f"bearer {token}",
-            "User-Agent": USER_AGENT,
-        }
+        session = _authorize(session or get_session(), token)
 
-        url = f"https://oauth.reddit.com/comments/{post_id}"
+        url = f"{BASE_URL}/comments/{post_id}"
 
-        response = requests.get(url=url, headers=headers, timeout=30)
+        response = session.get(url=url, timeout=30)
 
         response.raise_for_status()
 
-        data = response.json()
-
-        # Validate response structure
-        if not isinstance(data, list) or len(data) < 2:
-            raise KeyError("Invalid API response structure")
-
-        # Process comments data
-        def extract_comments(
-            comment_data: Dict[str, Any], parent_id: str = None, level: int = 0
-        ):
-            """
-            Extracts structured comment data from a given comment object, including replies (nested comments).
-
-            This function recursively processes comments and their replies from a Reddit API structure.
-            It extracts essential details such as the comment ID, post ID, author, body, score, and metadata about
-            the comment (e.g., whether it is edited, stickied, etc.). It also processes replies, if present, and
-            attaches the parent comment ID to each child comment.
-
-            Args:
-                comment_data (Dict[str, Any]): A dictionary containing the comment's data.
-                parent_id (str, optional): The ID of the parent comment, used for nested comments. Defaults to None.
-                level (int, optional): The level of nesting (starting at 0 for the root comment). Defaults to 0.
-
-            Returns:
-                List[Dict[str, Any]]: A list of dictionaries containing structured comment data, including replies if any.
-            """
-            processed = []
-
-            if not isinstance(comment_data, dict):
-                return processed
-
-            # Extract basic comment data
-            comment = {
-                "comment_id": comment_data.get("id"),
-                "post_id": post_id,
-                "parent_comment_id": parent_id,
-                "author": comment_data.get("author"),
-                "body": comment_data.get("body"),
-                "score": comment_data.get("score"),
-                "created_utc": comment_data.get("created_utc"),
-                "edited": comment_data.get("edited", False),
-                "is_submitter": comment_data.get("is_submitter", False),
-                "stickied": comment_data.get("stickied", False),
-                "level": level,
-            }
-
-            processed.append(comment)
-
-            # Process replies if they exist
-            replies = comment_data.get("replies", "")
-            if isinstance(replies, dict):
-                children = replies.get("data", {}).get("children", [])
-                for child in children:
-                    if (
-                        child.get("kind") == "t1"
-                    ):  # t1 is the prefix for comments
-                        child_data = child.get("data", {})
-                        processed.extend(
-                            extract_comments(
-                                child_data,
-                                parent_id=comment["comment_id"],
-                                level=level + 1,
-                            )
-                        )
-
-            return processed
-
-        # Process all top-level comments
-        all_comments = []
-        comment_listing = data[1]["data"]["children"]
-
-        for comment in comment_listing:
-            if comment["kind"] == "t1":  # Ensure it's a comment
-                all_comments.extend(extract_comments(comment["data"]))
-
-        return all_comments
+        data = orjson.loads(response.content)
+
+        return parse_comments(data, post_id)
 
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(
@@ -237,3 +465,45 @@ def fetch_comments(post_id: str, token: str):
         )
     except (KeyError, ValueError, TypeError) as e:
         raise ValueError(f"Error processing comment data: {str(e)}")
+
+
+def fetch_comments_bulk(
+    post_ids: List[str], token: str, max_workers: int = 8
+) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Fetches comments for many Reddit posts concurrently.
+
+    Requests are spread over a thread pool sharing one pooled Session and are
+    throttled to Reddit's OAuth rate limit of 60 requests per minute. Reddit
+    only serves comment trees per post, so this still issues one request per
+    ID; use `fetch_posts_info` to batch post metadata lookups.
+
+    Args:
+        post_ids (List[str]): IDs of the Reddit posts to fetch comments for.
+        token (str): The OAuth token for authenticating the API requests.
+        max_workers (int, optional): Number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, List[Any]]]: Column-wise comment data (as returned
+                                         by `fetch_comments`) keyed by post ID.
+
+    Raises:
+        ValueError: If max_workers is invalid or comment data cannot be processed.
+        requests.exceptions.RequestException: If any API request fails.
+    """
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    session = _build_session(pool_maxsize=max_workers)
+    limiter = _RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+
+    def fetch(post_id: str) -> Dict[str, List[Any]]:
+        limiter.acquire()
+        return fetch_comments(post_id, token, session=session)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(fetch, post_ids)
+            return dict(zip(post_ids, results))
+    finally:
+        session.close()
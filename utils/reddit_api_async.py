@@ -0,0 +1,202 @@
+# type: ignore
+import asyncio
+import httpx
+from utils.config import reddit_user_agent
+from utils.reddit_common import (
+    BACKOFF_FACTOR,
+    BASE_URL,
+    MAX_RETRIES,
+    RATE_LIMIT_PERIOD,
+    RATE_LIMIT_REQUESTS,
+    RETRY_STATUSES,
+    orjson,
+    parse_comments,
+)
+from typing import List, Dict, Any
+
+
+class _AsyncRateLimiter:
+    """Sliding-window limiter: each acquired slot is released after `period` seconds."""
+
+    def __init__(self, max_requests: int, period: float):
+        self._semaphore = asyncio.Semaphore(max_requests)
+        self._period = period
+
+    async def acquire(self) -> None:
+        await self._semaphore.acquire()
+        asyncio.get_running_loop().call_later(
+            self._period, self._semaphore.release
+        )
+
+
+def _build_client(max_connections: int = 20) -> httpx.AsyncClient:
+    """
+    Build an HTTP/2 AsyncClient so concurrent requests share one connection.
+
+    Args:
+        max_connections (int, optional): Maximum number of open connections.
+                                         Defaults to 20.
+
+    Returns:
+        httpx.AsyncClient: Client with the Reddit User-Agent set
+    """
+    user_agent = reddit_user_agent()
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=max_connections),
+        headers={"User-Agent": user_agent},
+        timeout=30,
+    )
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retry number `attempt + 1`.
+
+    Honours a numeric Retry-After header, otherwise backs off exponentially
+    like the urllib3 Retry used by the sync client.
+    """
+    retry_after = response.headers.get("Retry-After") if response else None
+    try:
+        return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        return BACKOFF_FACTOR * (2**attempt)
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient, url: str, headers: Dict[str, str]
+) -> httpx.Response:
+    """
+    GET `url`, retrying transport errors and 429/5xx responses with backoff.
+
+    Args:
+        client (httpx.AsyncClient): Client to issue the request on.
+        url (str): URL to fetch.
+        headers (Dict[str, str]): Per-request headers.
+
+    Returns:
+        httpx.Response: The first non-retryable response, or the last response
+                        once retries are exhausted.
+
+    Raises:
+        httpx.TransportError: If the request still fails after all retries.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = None
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt == MAX_RETRIES
+            ):
+                return response
+
+        await asyncio.sleep(_retry_delay(response, attempt))
+
+
+async def fetch_comments_async(
+    client: httpx.AsyncClient, post_id: str, token: str
+) -> Dict[str, List[Any]]:
+    """
+    Fetches and processes comments for a given Reddit post.
+
+    Args:
+        client (httpx.AsyncClient): Client to issue the request on.
+        post_id (str): The ID of the Reddit post to fetch comments for.
+        token (str): The OAuth token for authenticating the API request.
+
+    Returns:
+        Dict[str, List[Any]]: Processed comment data as columns, one list per
+                              field, as returned by `reddit_api.fetch_comments`.
+
+    Raises:
+        ValueError: If the post_id is invalid or if there is an error processing the comment data.
+        httpx.HTTPError: If there is a network-related error during the API request.
+    """
+    if not post_id or not isinstance(post_id, str):
+        raise ValueError("Post ID must be a non-empty string")
+
+    try:
+        headers = {"Authorization": f"bearer {token}"}
+
+        url = f"{BASE_URL}/comments/{post_id}"
+
+        response = await _get_with_retry(client, url, headers)
+
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        return parse_comments(data, post_id)
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(
+            f"Failed to fetch comments for post {post_id}: {str(e)}"
+        )
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(f"Error processing comment data: {str(e)}")
+
+
+async def gather_comments(
+    post_ids: List[str], token: str, max_connections: int = 20
+) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Fetches comments for many Reddit posts concurrently on one event loop.
+
+    Requests are multiplexed over a single HTTP/2 connection and throttled to
+    Reddit's OAuth rate limit of 60 requests per minute. Transport errors and
+    429/5xx responses are retried with the same backoff as the sync client.
+
+    Args:
+        post_ids (List[str]): IDs of the Reddit posts to fetch comments for.
+        token (str): The OAuth token for authenticating the API requests.
+        max_connections (int, optional): Maximum number of open connections.
+                                         Defaults to 20.
+
+    Returns:
+        Dict[str, Dict[str, List[Any]]]: Column-wise comment data keyed by post ID.
+
+    Raises:
+        ValueError: If comment data cannot be processed.
+        httpx.HTTPError: If any API request fails.
+    """
+    limiter = _AsyncRateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+
+    async with _build_client(max_connections) as client:
+
+        async def fetch(post_id: str) -> Dict[str, List[Any]]:
+            await limiter.acquire()
+            return await fetch_comments_async(client, post_id, token)
+
+        results = await asyncio.gather(*(fetch(pid) for pid in post_ids))
+
+    return dict(zip(post_ids, results))
+
+
+def fetch_comments_bulk_async_run(
+    post_ids: List[str], token: str, max_connections: int = 20
+) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Synchronous entry point for `gather_comments`, for callers without an event loop.
+
+    Unlike `reddit_api.fetch_comments_bulk`, failures surface as
+    `httpx.HTTPError` rather than `requests.exceptions.RequestException`.
+
+    Args:
+        post_ids (List[str]): IDs of the Reddit posts to fetch comments for.
+        token (str): The OAuth token for authenticating the API requests.
+        max_connections (int, optional): Maximum number of open connections.
+                                         Defaults to 20.
+
+    Returns:
+        Dict[str, Dict[str, List[Any]]]: Column-wise comment data keyed by post ID.
+
+    Raises:
+        ValueError: If comment data cannot be processed.
+        httpx.HTTPError: If any API request fails.
+    """
+    return asyncio.run(gather_comments(post_ids, token, max_connections))
@@ -0,0 +1,118 @@
+from typing import List, Dict, Any, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    import json as orjson
+
+# Base URL for authenticated Reddit API requests
+BASE_URL = "https://oauth.reddit.com"
+
+# Reddit OAuth clients are limited to 60 requests per minute
+RATE_LIMIT_REQUESTS = 60
+RATE_LIMIT_PERIOD = 60.0
+
+# Retry rate limiting and transient server errors with exponential backoff
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 1.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def walk_comments(
+    children: List[Dict[str, Any]], parent_id: str = None, level: int = 0
+) -> Iterator[Tuple[Dict[str, Any], str, int]]:
+    """
+    Yields comments from a Reddit comment listing, depth-first in listing order.
+
+    Nested replies are walked with an explicit stack of child iterators rather
+    than recursion, so arbitrarily deep threads neither hit the recursion limit
+    nor build intermediate lists per level.
+
+    Args:
+        children (List[Dict[str, Any]]): The `children` of a comment listing.
+        parent_id (str, optional): ID of the comment owning `children`. Defaults to None.
+        level (int, optional): Nesting level of `children`. Defaults to 0.
+
+    Yields:
+        Tuple[Dict[str, Any], str, int]: The comment's data, its parent comment ID
+                                         and its nesting level.
+    """
+    stack = [(iter(children), parent_id, level)]
+    while stack:
+        siblings, parent_id, level = stack[-1]
+        for child in siblings:
+            comment_data = child.get("data")
+            # t1 is the prefix for comments
+            if child.get("kind") != "t1" or not isinstance(comment_data, dict):
+                continue
+
+            yield comment_data, parent_id, level
+
+            # Descend into replies if they exist
+            replies = comment_data.get("replies", "")
+            if isinstance(replies, dict):
+                stack.append(
+                    (
+                        iter(replies.get("data", {}).get("children", [])),
+                        comment_data.get("id"),
+                        level + 1,
+                    )
+                )
+                break
+        else:
+            stack.pop()
+
+
+def parse_comments(data: Any, post_id: str) -> Dict[str, List[Any]]:
+    """
+    Flattens a decoded `/comments/{post_id}` response into comment columns.
+
+    Args:
+        data (Any): The decoded JSON response.
+        post_id (str): The ID of the Reddit post the comments belong to.
+
+    Returns:
+        Dict[str, List[Any]]: Processed comment data as columns, one list per field.
+
+    Raises:
+        KeyError: If the response structure is invalid.
+    """
+    # Validate response structure
+    if not isinstance(data, list) or len(data) < 2:
+        raise KeyError("Invalid API response structure")
+
+    # Fields are collected column-wise so the result can be handed to
+    # pd.DataFrame directly without pivoting one dict per comment.
+    comment_ids, parent_ids, authors, bodies, scores = [], [], [], [], []
+    created, edited, is_submitter, stickied, levels = [], [], [], [], []
+
+    for comment_data, parent_id, level in walk_comments(
+        data[1]["data"]["children"]
+    ):
+        # Extract basic comment data; bind .get once per comment since
+        # this loop runs for every comment in the thread
+        get = comment_data.get
+        comment_ids.append(get("id"))
+        parent_ids.append(parent_id)
+        authors.append(get("author"))
+        bodies.append(get("body"))
+        scores.append(get("score"))
+        created.append(get("created_utc"))
+        edited.append(get("edited", False))
+        is_submitter.append(get("is_submitter", False))
+        stickied.append(get("stickied", False))
+        levels.append(level)
+
+    return {
+        "comment_id": comment_ids,
+        "post_id": [post_id] * len(comment_ids),
+        "parent_comment_id": parent_ids,
+        "author": authors,
+        "body": bodies,
+        "score": scores,
+        "created_utc": created,
+        "edited": edited,
+        "is_submitter": is_submitter,
+        "stickied": stickied,
+        "level": levels,
+    }